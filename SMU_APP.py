@@ -1,14 +1,77 @@
 import tkinter as tk
-import matplotlib.pyplot as plt
 from tkinter import ttk, messagebox, filedialog
 import pyvisa
 import numpy as np
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+import collections
 import time
 import csv
+import re
+import sys
 from datetime import datetime
 import logging
 
+def _compute_resistance_numpy(v, i):
+    """Vectorized |V/I| with open-circuit points mapped to +inf"""
+    safe_i = np.where(np.abs(i) > 1e-12, i, np.nan)
+    with np.errstate(invalid='ignore'):
+        r = np.abs(v / safe_i)
+    r[np.isnan(r)] = np.inf
+    return r
+
+# Optional numba acceleration for the resistance kernel; the NumPy
+# version above is used when numba is not installed
+try:
+    import numba
+
+    @numba.njit(cache=True, fastmath=True)
+    def compute_resistance(v, i):
+        # Reciprocal-select form keeps the loop body branch-predictable
+        # so LLVM can vectorize the division under fastmath
+        out = np.empty(v.size, dtype=v.dtype)
+        for k in range(v.size):
+            inv = 1.0 / i[k] if abs(i[k]) > 1e-12 else 0.0
+            out[k] = abs(v[k] * inv) if inv != 0.0 else np.inf
+        return out
+except ImportError:
+    compute_resistance = _compute_resistance_numpy
+
+# Keithley SMUs resolve fewer than 6.5 digits, so float32 is ample and
+# halves memory and transfer bandwidth compared to float64
+DTYPE = np.float32
+
+def _decimate(arr, n=2000):
+    """Stride-slice a dense trace down to about n points for plotting"""
+    if len(arr) <= n:
+        return arr
+    return arr[::max(1, len(arr) // n)]
+
+# One %-format pass covers all three numeric table columns; cheaper than
+# three separate f-strings per row
+_ROW_FMT = "%.6f|%.6e|%.6e"
+
+# Numeric tokens in an otherwise malformed instrument response
+_NUMBER_RE = re.compile(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?')
+
+# Shared combobox choices, built once at import instead of per widget
+_CURRENT_RANGES = ("AUTO", "1e-9", "1e-8", "1e-7", "1e-6", "1e-5", "1e-4", "1e-3", "1e-2", "1e-1", "1")
+_SOURCE_TYPES = ("Voltage", "Current")
+_WIRE_MODES = ("2-Wire", "4-Wire")
+
+# Structured dtype for measurement storage: one contiguous typed array
+# instead of a growing list of per-point dicts
+POINT_DTYPE = np.dtype([
+    ('t', np.float64),
+    ('voltage', DTYPE),
+    ('current', DTYPE),
+    ('resistance', DTYPE),
+    ('cycle', 'i4'),
+    ('state', 'U16'),
+    ('extra', 'U24'),
+])
+
 class KeithleySMUController:
     def __init__(self, root):
         self.root = root
@@ -19,21 +82,97 @@ class KeithleySMUController:
         self.rm = None
         self.smu = None
         self.connected = False
+        # Workers watch this event; waits on it are interruptible, unlike
+        # a polled boolean plus time.sleep
+        self.stop_event = threading.Event()
+        # Set by each worker on exit so shutdown can wait exactly as long
+        # as the thread actually needs
+        self._stopped = threading.Event()
+        self._stopped.set()
+        self.worker_thread = None
         self.measurement_running = False
-        self.data_points = []
+        self.data_points = np.empty(0, dtype=POINT_DTYPE)
+        self._point_count = 0
+        self._buf_pool = {}
+
+        # Small executor that overlaps the next source-level write with
+        # host-side parsing of the previous reading; pyvisa sessions are
+        # thread-safe only with explicit locking, hence _io_lock. With two
+        # instruments the same executor can drive both sessions in parallel.
+        self._io_lock = threading.Lock()
+        self._io_exec = ThreadPoolExecutor(max_workers=2)
         
         # Model identification variables
         self.model = None
         self.series_2400 = False
         self.series_2600 = False
         self.data_format_set = False
+        self.binary_format = False
+        # Last settings actually written to the instrument, so re-running a
+        # test with unchanged parameters skips the whole setup write burst
+        self._last_smu_state = {}
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
+
+        # One VISA resource manager for the app's lifetime; opening one per
+        # action re-initializes the VISA library each time. Scan results are
+        # cached briefly because list_resources() can take seconds on NI-VISA.
+        try:
+            self.rm = pyvisa.ResourceManager()
+        except Exception as e:
+            self.logger.warning(f"Could not create VISA resource manager: {e}")
+        self._resources_cache = (0.0, ())
         
+        # Rows from measurement threads destined for the data table; workers
+        # never touch Tk directly, the queue is drained on the main thread
+        self._ui_queue = queue.Queue(maxsize=4096)
+
+        # Only the newest rows are kept in the Treeview widget; the full
+        # dataset lives in data_points, so widget cost stays constant
+        self._tree_iids = collections.deque()
+        self._max_tree_rows = 500
+
+        # Latest-value-wins progress/status published by workers and applied
+        # once per pump tick
+        self._latest_progress = None
+        self._latest_status = None
+
         # Create the GUI
         self.create_gui()
+
+        # Importing pyplot warms matplotlib's font cache, which can take
+        # hundreds of milliseconds cold; do it in the background now (the
+        # backend was already selected by the live-plot widget) so the
+        # first click on Plot does not stall the UI
+        self._plt = None
+        threading.Thread(target=self._preload_mpl, name="mpl-preload",
+                         daemon=True).start()
+
+        # Start/stop button groups flipped together by _set_ui_state; the
+        # cached state keeps repeat transitions from re-touching Tcl
+        self._ui_state = None
+        self._start_btns = (self.iv_start_btn, self.loop_start_btn,
+                            self.ret_start_btn, self.end_start_btn)
+        self._stop_btns = (self.iv_stop_btn, self.loop_stop_btn,
+                           self.ret_stop_btn, self.end_stop_btn)
+
+        # Start the GUI update pump
+        self.root.after(50, self._drain_queue)
+
+    @property
+    def measurement_running(self):
+        """True while a measurement worker should keep acquiring"""
+        return not self.stop_event.is_set()
+
+    @measurement_running.setter
+    def measurement_running(self, running):
+        if running:
+            self._stopped.clear()
+            self.stop_event.clear()
+        else:
+            self.stop_event.set()
     
     def create_gui(self):
         """Create the main GUI layout"""
@@ -118,7 +257,7 @@ class KeithleySMUController:
         # Source type
         ttk.Label(params_frame, text="Source Type:").grid(row=0, column=0, sticky=tk.W)
         self.iv_source_type = tk.StringVar(value="Voltage")
-        ttk.Combobox(params_frame, textvariable=self.iv_source_type, values=["Voltage", "Current"], state="readonly").grid(row=0, column=1, padx=(5, 0))
+        ttk.Combobox(params_frame, textvariable=self.iv_source_type, values=_SOURCE_TYPES, state="readonly").grid(row=0, column=1, padx=(5, 0))
         
         # Start value
         ttk.Label(params_frame, text="Start Value:").grid(row=1, column=0, sticky=tk.W)
@@ -144,7 +283,7 @@ class KeithleySMUController:
         ttk.Label(params_frame, text="Current Range (A):").grid(row=5, column=0, sticky=tk.W)
         self.iv_current_range = tk.StringVar(value="AUTO")
         current_range_combo = ttk.Combobox(params_frame, textvariable=self.iv_current_range, 
-                                         values=["AUTO", "1e-9", "1e-8", "1e-7", "1e-6", "1e-5", "1e-4", "1e-3", "1e-2", "1e-1", "1"], 
+                                         values=_CURRENT_RANGES,
                                          width=12)
         current_range_combo.grid(row=5, column=1, padx=(5, 0))
         
@@ -175,7 +314,7 @@ class KeithleySMUController:
         # Source type
         ttk.Label(params_frame, text="Source Type:").grid(row=0, column=0, sticky=tk.W)
         self.dc_source_type = tk.StringVar(value="Voltage")
-        ttk.Combobox(params_frame, textvariable=self.dc_source_type, values=["Voltage", "Current"], state="readonly").grid(row=0, column=1, padx=(5, 0))
+        ttk.Combobox(params_frame, textvariable=self.dc_source_type, values=_SOURCE_TYPES, state="readonly").grid(row=0, column=1, padx=(5, 0))
         
         # Bias value
         ttk.Label(params_frame, text="Bias Value:").grid(row=1, column=0, sticky=tk.W)
@@ -191,7 +330,7 @@ class KeithleySMUController:
         ttk.Label(params_frame, text="Current Range (A):").grid(row=3, column=0, sticky=tk.W)
         self.dc_current_range = tk.StringVar(value="AUTO")
         ttk.Combobox(params_frame, textvariable=self.dc_current_range, 
-                    values=["AUTO", "1e-9", "1e-8", "1e-7", "1e-6", "1e-5", "1e-4", "1e-3", "1e-2", "1e-1", "1"], 
+                    values=_CURRENT_RANGES,
                     width=12).grid(row=3, column=1, padx=(5, 0))
         
         # Control buttons
@@ -216,7 +355,7 @@ class KeithleySMUController:
         # Wire mode
         ttk.Label(params_frame, text="Wire Mode:").grid(row=0, column=0, sticky=tk.W)
         self.res_wire_mode = tk.StringVar(value="2-Wire")
-        ttk.Combobox(params_frame, textvariable=self.res_wire_mode, values=["2-Wire", "4-Wire"], state="readonly").grid(row=0, column=1, padx=(5, 0))
+        ttk.Combobox(params_frame, textvariable=self.res_wire_mode, values=_WIRE_MODES, state="readonly").grid(row=0, column=1, padx=(5, 0))
         
         # Test current
         ttk.Label(params_frame, text="Test Current (A):").grid(row=1, column=0, sticky=tk.W)
@@ -284,7 +423,7 @@ class KeithleySMUController:
         ttk.Label(params_frame, text="Current Range (A):").grid(row=4, column=0, sticky=tk.W)
         self.loop_current_range = tk.StringVar(value="AUTO")
         ttk.Combobox(params_frame, textvariable=self.loop_current_range, 
-                    values=["AUTO", "1e-9", "1e-8", "1e-7", "1e-6", "1e-5", "1e-4", "1e-3", "1e-2", "1e-1", "1"], 
+                    values=_CURRENT_RANGES,
                     width=12).grid(row=4, column=1, padx=(5, 0))
         
         # Delay between points
@@ -296,6 +435,11 @@ class KeithleySMUController:
         ttk.Label(params_frame, text="Number of Loops:").grid(row=6, column=0, sticky=tk.W)
         self.loop_cycles = tk.StringVar(value="5")
         ttk.Entry(params_frame, textvariable=self.loop_cycles, width=15).grid(row=6, column=1, padx=(5, 0))
+
+        # Dual channel (2600-series only): sweep two devices in one run
+        self.loop_dual_channel = tk.BooleanVar(value=False)
+        ttk.Checkbutton(params_frame, text="Dual channel (2600-series only)",
+                        variable=self.loop_dual_channel).grid(row=7, column=0, columnspan=2, sticky=tk.W)
         
         # Control buttons
         btn_frame = ttk.Frame(loop_frame)
@@ -436,9 +580,9 @@ class KeithleySMUController:
         self.data_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Scrollbars for treeview
-        v_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.data_tree.yview)
-        v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.data_tree.configure(yscrollcommand=v_scrollbar.set)
+        self._vscroll = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.data_tree.yview)
+        self._vscroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.data_tree.configure(yscrollcommand=self._vscroll.set)
         
         h_scrollbar = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL, command=self.data_tree.xview)
         h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
@@ -447,24 +591,11 @@ class KeithleySMUController:
         table_frame.columnconfigure(0, weight=1)
         table_frame.rowconfigure(0, weight=1)
         
-        # Plot info tab
+        # Live plot tab
         plot_frame = ttk.Frame(results_notebook)
-        results_notebook.add(plot_frame, text="Plot Info")
-        
-        plot_info = ttk.Label(plot_frame, text="Plotting Information:\n\n" +
-                             "Data visualization can be added using matplotlib.\n" +
-                             "Current version saves data to CSV for external analysis.\n\n" +
-                             "To add live plotting:\n" +
-                             "1. Install matplotlib: pip install matplotlib\n" +
-                             "2. Import FigureCanvasTkAgg\n" +
-                             "3. Create embedded plots in this tab\n\n" +
-                             "Memristor-specific plots:\n" +
-                             "- IV loop hysteresis curves\n" +
-                             "- Retention vs time plots\n" +
-                             "- Endurance resistance vs cycle plots",
-                             justify=tk.LEFT)
-        plot_info.grid(row=0, column=0, padx=20, pady=20, sticky=tk.W)
-        
+        results_notebook.add(plot_frame, text="Live Plot")
+        self._create_live_plot(plot_frame)
+
         # Data export controls
         export_frame = ttk.Frame(results_frame)
         export_frame.grid(row=1, column=0, pady=(10, 0))
@@ -473,6 +604,92 @@ class KeithleySMUController:
         ttk.Button(export_frame, text="Clear Data", command=self.clear_data).grid(row=0, column=1, padx=(0, 10))
         ttk.Button(export_frame, text="Plot Data (External)", command=self.plot_external).grid(row=0, column=2)
     
+    def _create_live_plot(self, parent):
+        """Embed a matplotlib canvas that is updated by blitting"""
+        self._live_canvas = None
+        self._live_bg = None
+        try:
+            import matplotlib
+            # Select TkAgg explicitly so the accelerated C blit path
+            # (Tk_PhotoPutBlock) is used for the embedded canvas
+            matplotlib.use('TkAgg')
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        except ImportError:
+            ttk.Label(parent, text="Matplotlib is not installed.\n"
+                                   "Install it with: pip install matplotlib",
+                      justify=tk.LEFT).pack(padx=20, pady=20, anchor=tk.W)
+            return
+
+        # matplotlib >= 3.5 releases the GIL during Tk blits, so the pyvisa
+        # worker thread keeps running while pixels are copied; older versions
+        # fall back to plain full draws
+        try:
+            self._fast_blit = tuple(int(p) for p in matplotlib.__version__.split('.')[:2]) >= (3, 5)
+        except ValueError:
+            self._fast_blit = False
+
+        fig = Figure(figsize=(6, 4), dpi=100)
+        self._live_ax = fig.add_subplot(111)
+        self._live_ax.set_xlabel('Voltage (V)')
+        self._live_ax.set_ylabel('Current (A)')
+        self._live_ax.grid(True, alpha=0.3)
+        # An animated line is kept out of the cached background so only the
+        # line has to be redrawn per update (blit path only)
+        (self._live_line,) = self._live_ax.plot([], [], 'b.-', linewidth=1,
+                                                markersize=2, animated=self._fast_blit)
+
+        self._live_canvas = FigureCanvasTkAgg(fig, master=parent)
+        self._live_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Any full draw (notably a window resize) invalidates the cached
+        # background; recapture it every time one happens so blits never
+        # restore a stale region
+        self._live_canvas.mpl_connect('draw_event', self._on_live_draw)
+        self._live_canvas.draw()
+
+    def _on_live_draw(self, event):
+        """Recapture the blit background after every full canvas draw"""
+        self._live_bg = self._live_canvas.copy_from_bbox(self._live_ax.bbox)
+
+    def _update_live_plot(self):
+        """Redraw only the data line via blitting instead of a full draw"""
+        if self._live_canvas is None or self._live_bg is None:
+            return
+        n = self._point_count
+        if n == 0:
+            return
+
+        data = self.data_points[:n]
+        # Decimate very long runs: the screen cannot show more points anyway
+        step = max(1, n // 10000)
+        xs = data['voltage'][::step]
+        ys = data['current'][::step]
+        self._live_line.set_data(xs, ys)
+
+        ax = self._live_ax
+        canvas = self._live_canvas
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        if xs.min() < x0 or xs.max() > x1 or ys.min() < y0 or ys.max() > y1:
+            # Data left the cached view: rescale once with some headroom so
+            # a steadily growing trace does not force a full redraw (and
+            # background recapture) on every frame
+            xlo, xhi = min(x0, float(xs.min())), max(x1, float(xs.max()))
+            ylo, yhi = min(y0, float(ys.min())), max(y1, float(ys.max()))
+            xpad = 0.1 * (xhi - xlo) or 1e-12
+            ypad = 0.1 * (yhi - ylo) or 1e-12
+            ax.set_xlim(xlo - xpad, xhi + xpad)
+            ax.set_ylim(ylo - ypad, yhi + ypad)
+            canvas.draw()  # the draw_event handler recaptures the background
+
+        if not self._fast_blit:
+            canvas.draw()
+            return
+
+        canvas.restore_region(self._live_bg)
+        ax.draw_artist(self._live_line)
+        canvas.blit(ax.bbox)
+
     def create_status_bar(self, parent):
         """Create status bar"""
         status_frame = ttk.Frame(parent)
@@ -492,8 +709,14 @@ class KeithleySMUController:
         try:
             if self.rm is None:
                 self.rm = pyvisa.ResourceManager()
-            
-            resources = self.rm.list_resources()
+
+            # Reuse a recent scan instead of re-enumerating the bus
+            ts, cached = self._resources_cache
+            if time.monotonic() - ts < 5.0:
+                resources = cached
+            else:
+                resources = self.rm.list_resources()
+                self._resources_cache = (time.monotonic(), resources)
             if resources:
                 # Create a simple selection dialog
                 selection_window = tk.Toplevel(self.root)
@@ -530,7 +753,16 @@ class KeithleySMUController:
             address = self.address_var.get()
             self.smu = self.rm.open_resource(address)
             self.smu.timeout = 30000  # 30 second timeout
-            
+            self.smu.chunk_size = 1 << 20  # large chunk so block reads need one transfer
+            # Explicit terminators let VISA end each read at the newline
+            # instead of splitting it over several chunk-sized low-level reads
+            self.smu.read_termination = '\n'
+            self.smu.write_termination = '\n'
+            self.smu.send_end = True
+            # No artificial pause between the write and read halves of a
+            # query; the termination character already delimits responses
+            self.smu.query_delay = 0.0
+
             # Test connection
             idn = self.smu.query("*IDN?")
             self.connected = True
@@ -551,7 +783,8 @@ class KeithleySMUController:
             
             # Configure instrument
             self._configure_instrument()
-            
+            self._set_os_timer_resolution(True)
+
         except Exception as e:
             self.logger.error(f"Connection error: {e}")
             messagebox.showerror("Connection Error", f"Failed to connect: {str(e)}")
@@ -560,9 +793,11 @@ class KeithleySMUController:
     def _configure_instrument(self):
         """Configure the instrument after connection"""
         try:
-            # Reset instrument
+            # Reset instrument; *OPC? blocks exactly until the reset is done
+            # instead of a worst-case fixed sleep
             self.smu.write("*RST")
-            time.sleep(1)
+            self.smu.query("*OPC?")
+            self._last_smu_state = {}
             
             # Clear errors
             try:
@@ -572,22 +807,28 @@ class KeithleySMUController:
             except Exception:
                 pass
             
-            # Set consistent data format for :READ?
+            # Set consistent data format: 32-bit binary blocks instead of ASCII
+            # so sweeps transfer ~4x fewer bytes and parse in C
             try:
                 if self.series_2400:
                     self.smu.write(":FORM:ELEM VOLT,CURR,TIME")
+                    self.smu.write(":FORM:DATA REAL,32")
+                    self.smu.write(":FORM:BORD SWAP")
                     self.data_format_set = True
+                    self.binary_format = True
                 elif self.series_2600:
-                    self.smu.write("format.data = format.ASCII")
+                    self.smu.write("format.data = format.SREAL")
                     self.data_format_set = True
+                    self.binary_format = True
             except Exception:
                 self.logger.warning("Could not set data format, using default parsing")
                 self.data_format_set = False
+                self.binary_format = False
             
             # Initialize source to voltage mode, 0V
             self.smu.write(":SOUR:FUNC VOLT")
             self.smu.write(":SOUR:VOLT:LEV 0")
-            self.smu.write(":OUTP OFF")
+            self._set_output(False)
             
             self.logger.info("Instrument configured successfully")
             
@@ -599,14 +840,17 @@ class KeithleySMUController:
     def disconnect_instrument(self):
         """Disconnect from the SMU instrument"""
         try:
-            # Stop any running measurement first
-            self.measurement_running = False
-            time.sleep(0.2)
+            # Stop any running measurement and wait for the worker to exit
+            self.stop_event.set()
+            if self.worker_thread is not None and self.worker_thread.is_alive():
+                self.worker_thread.join(timeout=2.0)
             
+            self._set_os_timer_resolution(False)
+            self._last_smu_state = {}
             if self.smu:
                 # Always turn off output before disconnecting
-                self.smu.write(":OUTP OFF")
-                time.sleep(0.1)
+                self._set_output(False)
+                self.smu.query("*OPC?")
                 self.smu.close()
                 self.smu = None
             
@@ -623,69 +867,410 @@ class KeithleySMUController:
             self.logger.error(f"Disconnect error: {e}")
             messagebox.showerror("Disconnect Error", f"Error disconnecting: {str(e)}")
     
-    def _safe_parse_reading(self, reading_str):
+    def _safe_parse_reading(self, reading_str, expected_fields=2):
         """Safely parse instrument reading"""
         try:
-            if self.data_format_set and self.series_2400:
-                # Expected format: voltage,current,time
-                parts = reading_str.strip().split(',')
-                if len(parts) >= 2:
-                    voltage = float(parts[0])
-                    current = float(parts[1])
-                    return voltage, current
-            
-            # Fallback parsing
-            parts = reading_str.strip().split(',')
-            if len(parts) >= 2:
-                values = []
-                for part in parts[:4]:
-                    try:
-                        val = float(part)
-                        values.append(val)
-                    except ValueError:
-                        continue
-                
-                if len(values) >= 2:
-                    return values[0], values[1]
-            
-            # If all else fails, return single value twice
-            val = float(parts[0])
-            return val, val
-            
+            # Fast path: convert all comma-separated fields in one C-level
+            # pass instead of splitting and float()-ing element by element.
+            # NumPy >= 2 raises on malformed input rather than parsing what
+            # it can, so failures fall through to the regex below
+            try:
+                arr = np.fromstring(reading_str, sep=',', dtype=np.float64)
+            except ValueError:
+                arr = np.empty(0)
+            if arr.size >= expected_fields:
+                return float(arr[0]), float(arr[1])
+
+            # Fallback for malformed responses: pull out whatever numeric
+            # tokens exist with one regex pass instead of raising and
+            # catching ValueError per field. A partial fromstring parse
+            # (NumPy 1.x stops at the first bad field) also lands here so
+            # later fields are not lost to value duplication
+            values = _NUMBER_RE.findall(reading_str)
+            if len(values) >= 2:
+                return float(values[0]), float(values[1])
+            if values:
+                val = float(values[0])
+                return val, val
+            raise ValueError("no numeric fields")
+
         except Exception as e:
             self.logger.error(f"Parse error for reading '{reading_str}': {e}")
             raise ValueError(f"Could not parse reading: {reading_str}")
-    
+
+    def _safe_parse_bulk(self, reading_str, points):
+        """Parse a bulk ASCII transfer into a (points, nfields) float array"""
+        arr = np.fromstring(reading_str, sep=',', dtype=np.float64)
+        if arr.size % points:
+            raise ValueError(f"Bulk reading has {arr.size} fields, "
+                             f"not a multiple of {points} points")
+        return arr.reshape(points, -1)
+
+    def _locked_write(self, cmd):
+        """Write a command while holding the VISA session lock"""
+        with self._io_lock:
+            self.smu.write(cmd)
+
+    def _write_many(self, *cmds):
+        """Send several SCPI commands as one semicolon-joined transaction
+
+        Each write() is a full bus round-trip, so chaining setup commands
+        into one message cuts configuration latency roughly by the number
+        of commands joined. Not applicable to 2600-series TSP statements.
+        """
+        self.smu.write(';'.join(cmds))
+
+    def _read_point(self):
+        """Read a single measurement point in the active data format"""
+        with self._io_lock:
+            if self.binary_format:
+                vals = self.smu.query_binary_values(":READ?", datatype='f',
+                                                    is_big_endian=False,
+                                                    container=np.ndarray)
+                if vals.size >= 2:
+                    return float(vals[0]), float(vals[1])
+                return float(vals[0]), float(vals[0])
+
+            reading = self.smu.query(":READ?")
+        return self._safe_parse_reading(reading)
+
+    def _set_os_timer_resolution(self, enable):
+        """Tighten the Windows scheduler tick to 1 ms while connected
+
+        Without this, sleeps and waits on Windows round up to the default
+        ~15 ms tick; other platforms need no adjustment.
+        """
+        if sys.platform != 'win32':
+            return
+        try:
+            import ctypes
+            if enable:
+                ctypes.windll.winmm.timeBeginPeriod(1)
+            else:
+                ctypes.windll.winmm.timeEndPeriod(1)
+        except Exception as e:
+            self.logger.warning(f"Could not adjust OS timer resolution: {e}")
+
+    def _precise_wait(self, dt):
+        """Wait dt seconds with sub-tick accuracy; True if stop was requested
+
+        time.sleep and Event.wait are quantized by the OS timer (~15 ms on
+        Windows), so millisecond settle delays can overshoot several-fold.
+        Long waits sleep through the bulk interruptibly, then the last
+        stretch spins on perf_counter.
+        """
+        end = time.perf_counter() + dt
+        if dt > 0.05:
+            if self.stop_event.wait(dt - 0.02):
+                return True
+        while time.perf_counter() < end:
+            if self.stop_event.is_set():
+                return True
+        return False
+
+    def _set_output(self, on):
+        """Switch the output, skipping the write when already in that state"""
+        state = 'ON' if on else 'OFF'
+        if self._last_smu_state.get('outp') == state:
+            return
+        self.smu.write(f":OUTP {state}")
+        if on:
+            self._settle()
+        self._last_smu_state['outp'] = state
+
+    def _settle(self):
+        """Block until the instrument has finished all pending operations
+
+        Replaces fixed time.sleep guards after output/bias changes: *OPC?
+        returns as soon as the SMU is actually ready instead of always
+        burning the worst-case delay.
+        """
+        self.smu.query("*OPC?")
+
+    def _run_hardware_sweep(self, start_val, stop_val, points, delay):
+        """Run a linear staircase sweep on the instrument itself (2400-series)
+
+        Programs the source memory sweep and trace buffer so the instrument
+        steps through all points on its own, then transfers every reading in
+        a single binary block instead of querying once per point.
+        """
+        self.smu.write(":SOUR:VOLT:MODE SWE")
+        self.smu.write(":SOUR:SWE:RANG BEST")
+        self.smu.write(":SOUR:SWE:SPAC LIN")
+        self.smu.write(f":SOUR:VOLT:STAR {start_val}")
+        self.smu.write(f":SOUR:VOLT:STOP {stop_val}")
+        self.smu.write(f":SOUR:SWE:POIN {points}")
+        self.smu.write(f":SOUR:DEL {delay}")
+        self.smu.write(f":TRIG:COUN {points}")
+        self.smu.write(f":TRAC:POIN {points}")
+        self.smu.write(":TRAC:FEED SENS1")
+        self.smu.write(":TRAC:FEED:CONT NEXT")
+        self._set_output(True)
+
+        # The *OPC? reply only arrives once the whole sweep has run, so
+        # scale the timeout with the sweep duration like the TSP helpers do
+        old_timeout = self.smu.timeout
+        self.smu.timeout = max(old_timeout, int(points * delay * 1000) + 60000)
+        try:
+            self.smu.write(":INIT")
+            self.smu.query("*OPC?")
+
+            if self.binary_format:
+                data = self.smu.query_binary_values(":TRAC:DATA?", datatype='f',
+                                                    is_big_endian=False,
+                                                    container=np.ndarray)
+            else:
+                # Still a single bulk transfer, just comma-separated ASCII
+                data = self._safe_parse_bulk(self.smu.query(":TRAC:DATA?"), points)
+        finally:
+            self.smu.timeout = old_timeout
+            # Restore fixed-level sourcing even if the sweep failed, so the
+            # per-point fallback never runs against a half-armed instrument
+            try:
+                self.smu.write(":ABOR")
+                self.smu.write(":TRAC:FEED:CONT NEV")
+                self.smu.write(":SOUR:VOLT:MODE FIX")
+            except Exception:
+                pass
+
+        # VOLT,CURR,TIME triplets per point
+        return data.reshape(-1, 3)
+
+    def _run_timed_acquisition(self, n_reads, interval):
+        """Acquire readings paced by the instrument's arm timer (2400-series)
+
+        The SMU takes one reading every `interval` seconds on its own and
+        buffers them, so the host sleeps through the acquisition and does a
+        single block transfer at the end instead of one timed query per read.
+        """
+        self.smu.write(f":ARM:COUN {n_reads}")
+        self.smu.write(":ARM:SOUR TIM")
+        self.smu.write(f":ARM:TIM {interval}")
+        self.smu.write(":TRIG:COUN 1")
+        self.smu.write(f":TRAC:POIN {n_reads}")
+        self.smu.write(":TRAC:FEED SENS1")
+        self.smu.write(":TRAC:FEED:CONT NEXT")
+        self.smu.write(":INIT")
+
+        # Sleep through the run, checking the buffer fill level occasionally
+        deadline = time.time() + n_reads * interval + 30
+        while self.measurement_running and time.time() < deadline:
+            if self.stop_event.wait(min(interval, 1.0)):
+                break
+            try:
+                if int(float(self.smu.query(":TRAC:POIN:ACT?"))) >= n_reads:
+                    break
+            except Exception:
+                pass
+
+        if not self.measurement_running:
+            self.smu.write(":ABOR")
+
+        try:
+            data = self.smu.query_binary_values(":TRAC:DATA?", datatype='f',
+                                                is_big_endian=False,
+                                                container=np.ndarray)
+        finally:
+            # Restore immediate arming even if the transfer failed, so the
+            # other measurement modes never block on a leftover arm timer
+            try:
+                self.smu.write(":ABOR")
+                self.smu.write(":TRAC:FEED:CONT NEV")
+                self.smu.write(":ARM:COUN 1")
+                self.smu.write(":ARM:SOUR IMM")
+            except Exception:
+                pass
+
+        return data.reshape(-1, 3)
+
+    def _run_tsp_endurance(self, vset, vreset, vread, cycles, pulse_width):
+        """Run the SET/READ/RESET/READ endurance loop on a 2600-series SMU
+
+        Uploads a TSP script so the instrument itself times the pulses and
+        stores the read currents in nvbuffer1; the host transfers the whole
+        buffer once at the end instead of exchanging four messages per cycle.
+        """
+        script = "\n".join([
+            "smua.nvbuffer1.clear()",
+            "smua.source.output = smua.OUTPUT_ON",
+            f"for n = 1, {cycles} do",
+            f"  smua.source.levelv = {vset}",
+            f"  delay({pulse_width})",
+            f"  smua.source.levelv = {vread}",
+            "  smua.measure.i(smua.nvbuffer1)",
+            f"  smua.source.levelv = {vreset}",
+            f"  delay({pulse_width})",
+            f"  smua.source.levelv = {vread}",
+            "  smua.measure.i(smua.nvbuffer1)",
+            "end",
+            "smua.source.levelv = 0",
+            "smua.source.output = smua.OUTPUT_OFF",
+            "print('DONE')",
+        ])
+        self.smu.write("loadscript endurance_run\n" + script + "\nendscript")
+
+        old_timeout = self.smu.timeout
+        # Each cycle spends two pulse widths plus two buffered measurements;
+        # budget ~20 ms per measurement so large cycle counts don't outlast
+        # the timeout while the script is still running
+        cycle_s = 2 * pulse_width + 2 * 0.020
+        self.smu.timeout = max(old_timeout, int(cycles * cycle_s * 1000) + 60000)
+        try:
+            self.smu.write("endurance_run.run()")
+            self.smu.read()  # blocks until the script prints DONE
+            currents = self.smu.query_binary_values(
+                f"printbuffer(1, {2 * cycles}, smua.nvbuffer1.readings)",
+                datatype='f', is_big_endian=False, container=np.ndarray)
+        finally:
+            self.smu.timeout = old_timeout
+
+        return currents
+
+    def _run_tsp_dual_sweep(self, values, delay):
+        """Sweep both channels of a 2600-series SMU together via TSP
+
+        Both channels step through the same voltage list locally on the
+        instrument and buffer their readings, so two devices are
+        characterized in the time of one sweep; the host fetches the two
+        buffers afterwards.
+        """
+        n = len(values)
+        vlist = ", ".join(f"{v:.6g}" for v in values)
+        script = "\n".join([
+            f"local vlist = {{{vlist}}}",
+            "smua.nvbuffer1.clear()",
+            "smub.nvbuffer1.clear()",
+            "smua.source.output = smua.OUTPUT_ON",
+            "smub.source.output = smub.OUTPUT_ON",
+            f"for k = 1, {n} do",
+            "  smua.source.levelv = vlist[k]",
+            "  smub.source.levelv = vlist[k]",
+            f"  delay({delay})",
+            "  smua.measure.i(smua.nvbuffer1)",
+            "  smub.measure.i(smub.nvbuffer1)",
+            "end",
+            "smua.source.levelv = 0",
+            "smub.source.levelv = 0",
+            "smua.source.output = smua.OUTPUT_OFF",
+            "smub.source.output = smub.OUTPUT_OFF",
+            "print('DONE')",
+        ])
+        self.smu.write("loadscript dual_sweep\n" + script + "\nendscript")
+
+        old_timeout = self.smu.timeout
+        self.smu.timeout = max(old_timeout, int(n * delay * 1000) + 60000)
+        try:
+            self.smu.write("dual_sweep.run()")
+            self.smu.read()  # blocks until the script prints DONE
+            i_a = self.smu.query_binary_values(
+                f"printbuffer(1, {n}, smua.nvbuffer1.readings)",
+                datatype='f', is_big_endian=False, container=np.ndarray)
+            i_b = self.smu.query_binary_values(
+                f"printbuffer(1, {n}, smub.nvbuffer1.readings)",
+                datatype='f', is_big_endian=False, container=np.ndarray)
+        finally:
+            self.smu.timeout = old_timeout
+
+        return i_a, i_b
+
+    def _run_tsp_sweep(self, values, delay):
+        """Sweep channel A of a 2600-series SMU locally via TSP
+
+        The instrument steps through the voltage list and buffers its
+        readings itself, the 2600 counterpart of the 2400 source-memory
+        sweep; the host fetches the buffer in one transfer afterwards.
+        """
+        n = len(values)
+        vlist = ", ".join(f"{v:.6g}" for v in values)
+        script = "\n".join([
+            f"local vlist = {{{vlist}}}",
+            "smua.nvbuffer1.clear()",
+            "smua.source.output = smua.OUTPUT_ON",
+            f"for k = 1, {n} do",
+            "  smua.source.levelv = vlist[k]",
+            f"  delay({delay})",
+            "  smua.measure.i(smua.nvbuffer1)",
+            "end",
+            "smua.source.levelv = 0",
+            "smua.source.output = smua.OUTPUT_OFF",
+            "print('DONE')",
+        ])
+        self.smu.write("loadscript iv_sweep\n" + script + "\nendscript")
+
+        old_timeout = self.smu.timeout
+        self.smu.timeout = max(old_timeout, int(n * delay * 1000) + 60000)
+        try:
+            self.smu.write("iv_sweep.run()")
+            self.smu.read()  # blocks until the script prints DONE
+            currents = self.smu.query_binary_values(
+                f"printbuffer(1, {n}, smua.nvbuffer1.readings)",
+                datatype='f', is_big_endian=False, container=np.ndarray)
+        finally:
+            self.smu.timeout = old_timeout
+
+        return currents
+
+    def _get_buffer(self, n):
+        """Return a reusable measurement buffer of n points
+
+        Buffers are pooled by capacity so back-to-back runs of the same test
+        reuse one allocation instead of churning the heap each time.
+        """
+        n = max(int(n), 1)
+        buf = self._buf_pool.get(n)
+        if buf is None:
+            buf = np.empty(n, dtype=POINT_DTYPE)
+            self._buf_pool[n] = buf
+        return buf
+
+    def _alloc_data(self, n):
+        """Preallocate the measurement buffer for an expected point count"""
+        self.data_points = self._get_buffer(n)
+        self._point_count = 0
+
+    def _record_point(self, timestamp, voltage, current, resistance, cycle, state, extra):
+        """Store one measurement into the preallocated buffer"""
+        if self._point_count >= self.data_points.shape[0]:
+            # Double the capacity for open-ended tests that outgrow the
+            # estimate, keeping the grown buffer pooled for the next run
+            grown = np.resize(self.data_points, max(2 * self.data_points.shape[0], 4096))
+            self._buf_pool[grown.shape[0]] = grown
+            self.data_points = grown
+        self.data_points[self._point_count] = (timestamp, voltage, current, resistance, cycle, state, extra)
+        self._point_count += 1
+
     def _set_current_compliance_and_range(self, compliance_current, current_range="AUTO"):
         """Set both compliance current and measurement range properly - THIS IS THE KEY FIX"""
         try:
+            # Skip the round-trips entirely when the instrument already has
+            # these exact settings (cache is cleared on stop/disconnect)
+            if self._last_smu_state.get('compliance') == (compliance_current, current_range):
+                self.logger.info(f"Compliance settings unchanged, skipping setup writes")
+                return
+
             # CRITICAL: Set both compliance and range for proper current measurement
-            
-            # 1. Set the source function to voltage
-            self.smu.write(":SOUR:FUNC VOLT")
-            
-            # 2. Set current compliance (limit)
+
             if self.series_2400:
-                self.smu.write(f":SOUR:VOLT:ILIM {compliance_current}")
-                
-                # 3. CRITICAL: Set current measurement range
+                # One semicolon-joined transaction: source function,
+                # compliance, measurement range, protection and sense
+                # function cost a single bus round-trip instead of six
                 if current_range == "AUTO":
-                    # Set range to accommodate the compliance current, but allow auto-ranging
-                    self.smu.write(":SENS:CURR:RANG:AUTO ON")
-                    # Set the upper limit of auto-ranging to include compliance current
+                    # Auto-range with an upper limit that includes compliance
                     range_value = max(compliance_current * 1.2, 1e-9)  # At least 1 nA range
-                    self.smu.write(f":SENS:CURR:RANG:UPP {range_value}")
+                    range_cmds = (":SENS:CURR:RANG:AUTO ON",
+                                  f":SENS:CURR:RANG:UPP {range_value}")
                 else:
-                    # Use fixed range
-                    self.smu.write(":SENS:CURR:RANG:AUTO OFF")
-                    range_value = float(current_range)
-                    self.smu.write(f":SENS:CURR:RANG {range_value}")
-                
-                # 4. Set current protection level (additional safety)
-                self.smu.write(f":SENS:CURR:PROT {compliance_current}")
-                
+                    range_cmds = (":SENS:CURR:RANG:AUTO OFF",
+                                  f":SENS:CURR:RANG {float(current_range)}")
+                self._write_many(":SOUR:FUNC VOLT",
+                                 f":SOUR:VOLT:ILIM {compliance_current}",
+                                 *range_cmds,
+                                 f":SENS:CURR:PROT {compliance_current}",
+                                 ":SENS:FUNC 'CURR'")
+
             elif self.series_2600:
-                # 2600 series uses different syntax
+                # 2600 series uses different syntax (TSP statements do not
+                # take semicolon chaining)
                 self.smu.write(f"smua.source.limiti = {compliance_current}")
                 if current_range != "AUTO":
                     self.smu.write(f"smua.measure.rangei = {current_range}")
@@ -693,20 +1278,23 @@ class KeithleySMUController:
                     self.smu.write("smua.measure.autorangei = smua.AUTORANGE_ON")
             else:
                 # Generic SCPI fallback
-                self.smu.write(f":SOUR:VOLT:ILIM {compliance_current}")
                 if current_range != "AUTO":
-                    self.smu.write(f":SENS:CURR:RANG {current_range}")
-                    self.smu.write(":SENS:CURR:RANG:AUTO OFF")
+                    range_cmds = (f":SENS:CURR:RANG {current_range}",
+                                  ":SENS:CURR:RANG:AUTO OFF")
                 else:
-                    self.smu.write(":SENS:CURR:RANG:AUTO ON")
-            
-            # 5. Set measurement function to current
-            self.smu.write(":SENS:FUNC 'CURR'")
-            
+                    range_cmds = (":SENS:CURR:RANG:AUTO ON",)
+                self._write_many(":SOUR:FUNC VOLT",
+                                 f":SOUR:VOLT:ILIM {compliance_current}",
+                                 *range_cmds,
+                                 ":SENS:FUNC 'CURR'")
+
             # 6. Log the settings for verification
+            self._last_smu_state['compliance'] = (compliance_current, current_range)
             self.logger.info(f"Set compliance current: {compliance_current} A, range: {current_range}")
-            self.status_var.set(f"Compliance: {compliance_current} A, Range: {current_range}")
-            
+            # Runs on worker threads; let the pump apply the status on the
+            # Tk thread instead of touching the variable here
+            self._report_progress(status=f"Compliance: {compliance_current} A, Range: {current_range}")
+
         except Exception as e:
             self.logger.error(f"Error setting compliance/range: {e}")
             raise Exception(f"Failed to set current compliance and range: {e}")
@@ -748,13 +1336,13 @@ class KeithleySMUController:
             
             # Start measurement in separate thread
             self.measurement_running = True
-            self.iv_start_btn.config(state=tk.DISABLED)
-            self.iv_stop_btn.config(state=tk.NORMAL)
+            self._set_ui_state('running')
             self.progress_var.set(0)
             
-            thread = threading.Thread(target=self._perform_iv_sweep,
+            thread = threading.Thread(target=self._perform_iv_sweep, name="iv-sweep-worker",
                                     args=(source_type, start_val, stop_val, points, compliance, current_range, delay))
             thread.daemon = True
+            self.worker_thread = thread
             thread.start()
             
         except ValueError as e:
@@ -765,38 +1353,78 @@ class KeithleySMUController:
     
     def _perform_iv_sweep(self, source_type, start_val, stop_val, points, compliance, current_range, delay):
         """Perform the actual I-V sweep measurement"""
+        pending = None
         try:
             # Configure SMU with proper current range and compliance
             if source_type == "Voltage":
                 self._set_current_compliance_and_range(compliance, current_range)
             else:
-                self.smu.write(":SOUR:FUNC CURR")
-                self.smu.write(f":SOUR:CURR:VLIM {compliance}")
-                self.smu.write(":SENS:FUNC 'VOLT'")
-            
-            self.smu.write(":OUTP ON")
-            time.sleep(0.1)
-            
+                self._write_many(":SOUR:FUNC CURR",
+                                 f":SOUR:CURR:VLIM {compliance}",
+                                 ":SENS:FUNC 'VOLT'")
+                # Sourcing current now; the next voltage-mode setup must
+                # re-apply its functions even with unchanged compliance
+                self._last_smu_state.pop('compliance', None)
+
+            self._alloc_data(points)
+
+            # Voltage sweeps run on the instrument itself and transfer as
+            # one block where the model supports it; other modes go
+            # point-by-point
+            if source_type == "Voltage" and self.series_2400:
+                try:
+                    self._perform_hardware_iv_sweep(start_val, stop_val, points, delay)
+                    return
+                except Exception as e:
+                    self.logger.warning(f"Hardware sweep failed, using per-point sweep: {e}")
+            elif source_type == "Voltage" and self.series_2600:
+                try:
+                    sweep_values = np.linspace(start_val, stop_val, points)
+                    self._report_progress(status="I-V Sweep running on instrument...")
+                    currents = self._run_tsp_sweep(sweep_values, delay)
+                    self._record_sweep_block(sweep_values, currents)
+                    return
+                except Exception as e:
+                    self.logger.warning(f"TSP sweep failed, using per-point sweep: {e}")
+                    # Stop the script if it is still executing so the
+                    # per-point sweep isn't competing with it for the channel
+                    try:
+                        self.smu.write("abort")
+                        self.smu.write("*CLS")
+                    except Exception:
+                        pass
+
+            self._set_output(True)
+
             # Generate sweep points
             sweep_values = np.linspace(start_val, stop_val, points)
-            self.data_points.clear()
-            
+            level_cmd = ":SOUR:VOLT:LEV" if source_type == "Voltage" else ":SOUR:CURR:LEV"
+            # Format every level command up front; float-to-string runs once
+            # per point here instead of inside the hot loop
+            level_cmds = [f"{level_cmd} {v:.6g}" for v in sweep_values]
+
+            # Two-stage pipeline: the next level is written on the I/O
+            # executor while this thread records the previous reading, so
+            # bus transit overlaps host-side work
+            pending = self._io_exec.submit(self._locked_write, level_cmds[0])
+
             for i, value in enumerate(sweep_values):
                 if not self.measurement_running:
                     break
-                
-                # Set source value
-                if source_type == "Voltage":
-                    self.smu.write(f":SOUR:VOLT:LEV {value}")
-                else:
-                    self.smu.write(f":SOUR:CURR:LEV {value}")
-                
-                time.sleep(delay)
-                
+
+                # Make sure this point's source level is on the instrument
+                pending.result()
+
+                if self._precise_wait(delay):
+                    break
+
                 # Read measurement
-                reading = self.smu.query(":READ?")
-                voltage, current = self._safe_parse_reading(reading)
-                
+                voltage, current = self._read_point()
+
+                # Queue the next level before doing any bookkeeping
+                if i + 1 < points:
+                    pending = self._io_exec.submit(self._locked_write, level_cmds[i + 1])
+
                 if source_type == "Voltage":
                     measured_value = current
                     resistance = abs(voltage / current) if abs(current) > 1e-12 else float('inf')
@@ -805,33 +1433,67 @@ class KeithleySMUController:
                     resistance = abs(voltage / current) if abs(current) > 1e-12 else float('inf')
                 
                 # Store data point
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                self.data_points.append({
-                    'timestamp': timestamp,
-                    'voltage': voltage,
-                    'current': current,
-                    'resistance': resistance,
-                    'cycle': 1,
-                    'state': 'Sweep',
-                    'extra': f"Point {i+1}"
-                })
+                timestamp = time.time()
+                self._record_point(timestamp, voltage, current, resistance, 1, 'Sweep', f"Point {i+1}")
                 
                 # Update GUI
                 progress = (i + 1) / points * 100
-                self.root.after(0, self._update_progress, progress)
-                self.root.after(0, self._update_data_table, timestamp, voltage, current, resistance, 1, 'Sweep', f"Point {i+1}")
-                self.root.after(0, self.status_var.set, f"I-V Sweep: Point {i+1}/{points} - Current: {current:.3e} A")
+                self._queue_row(timestamp, voltage, current, resistance, 1, 'Sweep', f"Point {i+1}")
+                self._report_progress(progress, f"I-V Sweep: Point {i+1}/{points} - Current: {current:.3e} A")
                 
         except Exception as e:
             self.logger.error(f"IV sweep error: {e}")
             self.root.after(0, messagebox.showerror, "Measurement Error", f"Error during I-V sweep: {str(e)}")
         finally:
+            # Drain any in-flight pipelined write before touching the VISA
+            # handle again; _set_output below doesn't take _io_lock
+            if pending is not None:
+                try:
+                    pending.result()
+                except Exception:
+                    pass
             try:
-                self.smu.write(":OUTP OFF")
+                self._set_output(False)
             except Exception:
                 pass
+            self._stopped.set()
             self.root.after(0, self._sweep_completed)
-    
+
+    def _perform_hardware_iv_sweep(self, start_val, stop_val, points, delay):
+        """Record an instrument-side sweep into the data table"""
+        acq_start = time.time()
+        data = self._run_hardware_sweep(start_val, stop_val, points, delay)
+        # The TIME element is relative to the sweep start; anchor it to the
+        # epoch instead of stamping every point with the readback time
+        self._record_sweep_block(data[:, 0], data[:, 1], acq_start + data[:, 2])
+
+    def _record_sweep_block(self, v, i, t=None):
+        """Store and display a whole instrument-acquired sweep at once
+
+        `t` carries per-point epoch timestamps where the acquisition path
+        provides them; otherwise every point is stamped with the current time.
+        """
+        # Vectorized resistance over the whole trace
+        r = compute_resistance(v, i)
+
+        # Bulk-assign the whole sweep into the structured array
+        n = len(v)
+        if n > self.data_points.shape[0]:
+            self._alloc_data(n)
+        block = self.data_points[:n]
+        block['t'] = t if t is not None else time.time()
+        block['voltage'] = v
+        block['current'] = i
+        block['resistance'] = r
+        block['cycle'] = 1
+        block['state'] = 'Sweep'
+        block['extra'] = [f"Point {k+1}" for k in range(n)]
+        self._point_count = n
+
+        # One GUI callback for the whole sweep instead of N
+        self.root.after(0, self._bulk_update_table, block)
+        self._report_progress(100, f"I-V Sweep: {n} points acquired from instrument buffer")
+
     def apply_dc_bias(self):
         """Apply DC bias"""
         if not self.connected:
@@ -849,11 +1511,13 @@ class KeithleySMUController:
                 self._set_current_compliance_and_range(compliance, current_range)
                 self.smu.write(f":SOUR:VOLT:LEV {value}")
             else:
-                self.smu.write(":SOUR:FUNC CURR")
-                self.smu.write(f":SOUR:CURR:LEV {value}")
-                self.smu.write(f":SOUR:CURR:VLIM {compliance}")
-            
-            self.smu.write(":OUTP ON")
+                self._write_many(":SOUR:FUNC CURR",
+                                 f":SOUR:CURR:LEV {value}",
+                                 f":SOUR:CURR:VLIM {compliance}")
+                # Source function changed behind the compliance cache's back
+                self._last_smu_state.pop('compliance', None)
+
+            self._set_output(True)
             self.status_var.set(f"Applied {source_type} bias: {value}, Compliance: {compliance} A")
             self.dc_output_btn.config(text="Output Off")
             
@@ -868,11 +1532,11 @@ class KeithleySMUController:
         
         try:
             if self.dc_output_btn.cget('text') == "Output Off":
-                self.smu.write(":OUTP OFF")
+                self._set_output(False)
                 self.dc_output_btn.config(text="Output On")
                 self.status_var.set("Output turned off")
             else:
-                self.smu.write(":OUTP ON")
+                self._set_output(True)
                 self.dc_output_btn.config(text="Output Off")
                 self.status_var.set("Output turned on")
                 
@@ -897,22 +1561,24 @@ class KeithleySMUController:
             self.smu.write(":SOUR:FUNC CURR")
             self.smu.write(f":SOUR:CURR:LEV {test_current}")
             self.smu.write(":SENS:FUNC 'VOLT'")
-            self.smu.write(":OUTP ON")
+            # Source function changed behind the compliance cache's back
+            self._last_smu_state.pop('compliance', None)
+            self._set_output(True)
             
-            time.sleep(0.1)
+            self._settle()
             
             # Read voltage
-            reading = self.smu.query(":READ?")
-            voltage, current_read = self._safe_parse_reading(reading)
+            voltage, current_read = self._read_point()
             
             # Calculate resistance
             resistance = voltage / test_current if test_current != 0 else float('inf')
             
-            self.smu.write(":OUTP OFF")
+            self._set_output(False)
             
             # Display result
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            timestamp = time.time()
             self._update_data_table(timestamp, test_current, current_read, resistance, 1, f"R-{wire_mode}", "Resistance")
+            self._scroll_to_latest()
             
             messagebox.showinfo("Resistance Measurement",
                               f"Resistance: {resistance:.6f} Ω\nTest Current: {test_current} A\n"
@@ -923,7 +1589,7 @@ class KeithleySMUController:
             messagebox.showerror("Error", f"Error measuring resistance: {str(e)}")
         finally:
             try:
-                self.smu.write(":OUTP OFF")
+                self._set_output(False)
             except Exception:
                 pass
     
@@ -942,6 +1608,9 @@ class KeithleySMUController:
             current_range = self.loop_current_range.get()
             delay = float(self.loop_delay.get())
             cycles = int(self.loop_cycles.get())
+            # Tk variables are read here on the main thread; Tcl is not
+            # thread-safe, so the worker gets a plain bool
+            dual_channel = self.loop_dual_channel.get()
             
             # Validate parameters
             if points <= 0:
@@ -955,13 +1624,13 @@ class KeithleySMUController:
             
             # Start measurement
             self.measurement_running = True
-            self.loop_start_btn.config(state=tk.DISABLED)
-            self.loop_stop_btn.config(state=tk.NORMAL)
+            self._set_ui_state('running')
             self.progress_var.set(0)
             
-            thread = threading.Thread(target=self._perform_iv_loop,
-                                    args=(vpos, vneg, points, compliance, current_range, delay, cycles))
+            thread = threading.Thread(target=self._perform_iv_loop, name="iv-loop-worker",
+                                    args=(vpos, vneg, points, compliance, current_range, delay, cycles, dual_channel))
             thread.daemon = True
+            self.worker_thread = thread
             thread.start()
             
         except ValueError as e:
@@ -969,73 +1638,109 @@ class KeithleySMUController:
         except Exception as e:
             messagebox.showerror("Error", f"Error starting IV loop test: {str(e)}")
     
-    def _perform_iv_loop(self, vpos, vneg, points, compliance, current_range, delay, cycles):
+    def _perform_iv_loop(self, vpos, vneg, points, compliance, current_range, delay, cycles, dual_channel):
         """Perform IV loop testing"""
         try:
             # Configure SMU with proper current settings
             self._set_current_compliance_and_range(compliance, current_range)
-            self.smu.write(":OUTP ON")
-            time.sleep(0.1)
-            
-            self.data_points.clear()
-            total_points = cycles * points * 4
+            self._set_output(True)
+            
+            # Triangular sweep built once: the segments do not depend on the
+            # cycle, so one contiguous array serves every pass
+            full = np.concatenate([
+                np.linspace(0, vpos, points),      # 0 to positive
+                np.linspace(vpos, vneg, points),   # positive to negative
+                np.linspace(vneg, 0, points),      # negative to 0
+                [0.0],                             # ensure we end at 0
+            ])
+            segment_names = ("0→+V", "+V→-V", "-V→0", "End")
+            state_ids = np.concatenate([
+                np.zeros(points, np.int8),
+                np.ones(points, np.int8),
+                np.full(points, 2, np.int8),
+                np.array([3], np.int8),
+            ])
+            level_cmds = [f":SOUR:VOLT:LEV {v:.6g}" for v in full]
+
+            total_points = cycles * full.size
+            self._alloc_data(total_points)
             point_count = 0
-            
+
+            # Dual-channel runs execute on the instrument, one cycle per TSP run
+            if self.series_2600 and dual_channel:
+                self._perform_iv_loop_dual(vpos, vneg, points, compliance, delay, cycles)
+                return
+
             for cycle in range(cycles):
                 if not self.measurement_running:
                     break
-                
-                # Triangular sweep segments
-                segments = [
-                    np.linspace(0, vpos, points),      # 0 to positive
-                    np.linspace(vpos, vneg, points),   # positive to negative
-                    np.linspace(vneg, 0, points),      # negative to 0
-                    np.array([0])                      # ensure we end at 0
-                ]
-                
-                segment_names = ["0→+V", "+V→-V", "-V→0", "End"]
-                
-                for seg_idx, segment in enumerate(segments):
-                    for i, voltage in enumerate(segment):
-                        if not self.measurement_running:
-                            break
-                        
-                        self.smu.write(f":SOUR:VOLT:LEV {voltage}")
-                        time.sleep(delay)
-                        
-                        reading = self.smu.query(":READ?")
-                        v_read, current = self._safe_parse_reading(reading)
-                        resistance = abs(v_read / current) if abs(current) > 1e-12 else float('inf')
-                        
-                        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                        self.data_points.append({
-                            'timestamp': timestamp,
-                            'voltage': voltage,
-                            'current': current,
-                            'resistance': resistance,
-                            'cycle': cycle + 1,
-                            'state': segment_names[seg_idx],
-                            'extra': f"Loop{cycle+1}-{segment_names[seg_idx]}"
-                        })
-                        
-                        point_count += 1
-                        progress = point_count / total_points * 100
-                        self.root.after(0, self._update_progress, progress)
-                        self.root.after(0, self._update_data_table, timestamp, voltage, current, resistance, 
-                                      cycle + 1, segment_names[seg_idx], f"Loop{cycle+1}")
-                        self.root.after(0, self.status_var.set, 
-                                      f"IV Loop: Cycle {cycle+1}/{cycles}, {segment_names[seg_idx]} - I: {current:.3e} A")
+
+                for idx, voltage in enumerate(full):
+                    if not self.measurement_running:
+                        break
+
+                    seg_name = segment_names[state_ids[idx]]
+                    self.smu.write(level_cmds[idx])
+                    if self._precise_wait(delay):
+                        break
+
+                    v_read, current = self._read_point()
+                    resistance = abs(v_read / current) if abs(current) > 1e-12 else float('inf')
+
+                    timestamp = time.time()
+                    self._record_point(timestamp, voltage, current, resistance,
+                                       cycle + 1, seg_name,
+                                       f"Loop{cycle+1}-{seg_name}")
+
+                    point_count += 1
+                    progress = point_count / total_points * 100
+                    self._queue_row(timestamp, voltage, current, resistance,
+                                    cycle + 1, seg_name, f"Loop{cycle+1}")
+                    self._report_progress(progress,
+                                          f"IV Loop: Cycle {cycle+1}/{cycles}, {seg_name} - I: {current:.3e} A")
                         
         except Exception as e:
             self.root.after(0, messagebox.showerror, "Measurement Error", f"Error during IV loop test: {str(e)}")
         finally:
             try:
-                self.smu.write(":SOUR:VOLT:LEV 0")
-                self.smu.write(":OUTP OFF")
+                self._write_many(":SOUR:VOLT:LEV 0", ":OUTP OFF")
+                self._last_smu_state['outp'] = 'OFF'
             except Exception:
                 pass
+            self._stopped.set()
             self.root.after(0, self._sweep_completed)
     
+    def _perform_iv_loop_dual(self, vpos, vneg, points, compliance, delay, cycles):
+        """IV loop on both 2600 channels at once, one TSP run per cycle"""
+        # Channel B compliance; channel A was set by the shared config path
+        self.smu.write(f"smub.source.limiti = {compliance}")
+
+        sweep = np.concatenate([
+            np.linspace(0, vpos, points),
+            np.linspace(vpos, vneg, points),
+            np.linspace(vneg, 0, points),
+            [0.0],
+        ])
+
+        for cycle in range(cycles):
+            if not self.measurement_running:
+                break
+
+            self._report_progress(status=f"IV Loop (dual): cycle {cycle+1}/{cycles} running on instrument...")
+            i_a, i_b = self._run_tsp_dual_sweep(sweep, delay)
+
+            for k, voltage in enumerate(sweep):
+                for chan, current in (('CH-A', i_a[k]), ('CH-B', i_b[k])):
+                    resistance = abs(voltage / current) if abs(current) > 1e-12 else float('inf')
+                    timestamp = time.time()
+                    self._record_point(timestamp, voltage, current, resistance,
+                                       cycle + 1, chan, f"Loop{cycle+1}-{chan}")
+                    self._queue_row(timestamp, voltage, current, resistance,
+                                    cycle + 1, chan, f"Loop{cycle+1}")
+
+            progress = (cycle + 1) / cycles * 100
+            self._report_progress(progress)
+
     def start_retention_test(self):
         """Start retention testing for memristors"""
         if not self.connected:
@@ -1061,13 +1766,13 @@ class KeithleySMUController:
             
             # Start measurement
             self.measurement_running = True
-            self.ret_start_btn.config(state=tk.DISABLED)
-            self.ret_stop_btn.config(state=tk.NORMAL)
+            self._set_ui_state('running')
             self.progress_var.set(0)
             
-            thread = threading.Thread(target=self._perform_retention_test,
+            thread = threading.Thread(target=self._perform_retention_test, name="retention-worker",
                                     args=(vset, vreset, vread, compliance, duration, interval))
             thread.daemon = True
+            self.worker_thread = thread
             thread.start()
             
         except ValueError as e:
@@ -1080,99 +1785,127 @@ class KeithleySMUController:
         try:
             # Configure SMU
             self._set_current_compliance_and_range(compliance, "AUTO")
-            self.smu.write(":OUTP ON")
-            time.sleep(0.1)
+            self._set_output(True)
             
-            self.data_points.clear()
+            self._alloc_data(int(duration / interval) + 2)
             half_duration = duration / 2
             
+            # Timer-armed acquisition lets the SMU pace the reads itself and
+            # the host fetch one block at the end. The 2400-series trace
+            # buffer holds at most 2500 readings, so longer runs fall back
+            # to the host-paced loop rather than programming an invalid
+            # :TRAC:POIN count
+            n_reads_half = max(int((duration / 2) / interval), 1)
+            hw_timed = (self.series_2400 and self.binary_format
+                        and n_reads_half <= 2500)
+
             # SET retention test (first half)
-            self.root.after(0, self.status_var.set, "Programming SET state...")
+            self._report_progress(status="Programming SET state...")
             self.smu.write(f":SOUR:VOLT:LEV {vset}")
-            time.sleep(0.1)
-            
+            self._settle()
+
+            if hw_timed:
+                self._perform_retention_half_hw('SET_retention', 1, vread, half_duration, interval, 0.0)
+                if not self.measurement_running:
+                    return
+
+                # RESET retention test (second half)
+                self._report_progress(status="Programming RESET state...")
+                self.smu.write(f":SOUR:VOLT:LEV {vreset}")
+                self._settle()
+
+                self._perform_retention_half_hw('RESET_retention', 2, vread, half_duration, interval, 50.0)
+                return
+
+            cmd_read_v = f":SOUR:VOLT:LEV {vread}"
             start_time = time.time()
             read_count = 0
             max_reads_set = int(half_duration / interval)
-            
+
             while self.measurement_running and (time.time() - start_time) < half_duration:
-                self.smu.write(f":SOUR:VOLT:LEV {vread}")
-                time.sleep(0.01)
-                reading = self.smu.query(":READ?")
-                v_read_val, current = self._safe_parse_reading(reading)
+                self.smu.write(cmd_read_v)
+                v_read_val, current = self._read_point()
                 resistance = abs(v_read_val / current) if abs(current) > 1e-12 else float('inf')
                 
                 elapsed = time.time() - start_time
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+                timestamp = time.time()
                 
-                self.data_points.append({
-                    'timestamp': timestamp,
-                    'voltage': vread,
-                    'current': current,
-                    'resistance': resistance,
-                    'cycle': 1,
-                    'state': 'SET_retention',
-                    'extra': f"SET@{elapsed:.1f}s"
-                })
+                self._record_point(timestamp, vread, current, resistance,
+                                   1, 'SET_retention', f"SET@{elapsed:.1f}s")
                 
                 read_count += 1
                 progress = (read_count / max_reads_set) * 50
-                self.root.after(0, self._update_progress, progress)
-                self.root.after(0, self._update_data_table, timestamp, vread, current, resistance, 1, 'SET_retention', f"SET@{elapsed:.1f}s")
-                self.root.after(0, self.status_var.set, f"SET Retention: {elapsed:.1f}s / {half_duration:.1f}s - R: {resistance:.2e} Ω")
+                self._queue_row(timestamp, vread, current, resistance, 1, 'SET_retention', f"SET@{elapsed:.1f}s")
+                self._report_progress(progress, f"SET Retention: {elapsed:.1f}s / {half_duration:.1f}s - R: {resistance:.2e} Ω")
                 
-                time.sleep(interval)
-            
+                if self.stop_event.wait(interval):
+                    break
+
             if not self.measurement_running:
                 return
             
             # RESET retention test (second half)
-            self.root.after(0, self.status_var.set, "Programming RESET state...")
+            self._report_progress(status="Programming RESET state...")
             self.smu.write(f":SOUR:VOLT:LEV {vreset}")
-            time.sleep(0.1)
+            self._settle()
             
             start_time = time.time()
             read_count = 0
             max_reads_reset = int(half_duration / interval)
             
             while self.measurement_running and (time.time() - start_time) < half_duration:
-                self.smu.write(f":SOUR:VOLT:LEV {vread}")
-                time.sleep(0.01)
-                reading = self.smu.query(":READ?")
-                v_read_val, current = self._safe_parse_reading(reading)
+                self.smu.write(cmd_read_v)
+                v_read_val, current = self._read_point()
                 resistance = abs(v_read_val / current) if abs(current) > 1e-12 else float('inf')
                 
                 elapsed = time.time() - start_time
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+                timestamp = time.time()
                 
-                self.data_points.append({
-                    'timestamp': timestamp,
-                    'voltage': vread,
-                    'current': current,
-                    'resistance': resistance,
-                    'cycle': 2,
-                    'state': 'RESET_retention',
-                    'extra': f"RESET@{elapsed:.1f}s"
-                })
+                self._record_point(timestamp, vread, current, resistance,
+                                   2, 'RESET_retention', f"RESET@{elapsed:.1f}s")
                 
                 read_count += 1
                 progress = 50 + (read_count / max_reads_reset) * 50
-                self.root.after(0, self._update_progress, progress)
-                self.root.after(0, self._update_data_table, timestamp, vread, current, resistance, 2, 'RESET_retention', f"RESET@{elapsed:.1f}s")
-                self.root.after(0, self.status_var.set, f"RESET Retention: {elapsed:.1f}s / {half_duration:.1f}s - R: {resistance:.2e} Ω")
-                
-                time.sleep(interval)
+                self._queue_row(timestamp, vread, current, resistance, 2, 'RESET_retention', f"RESET@{elapsed:.1f}s")
+                self._report_progress(progress, f"RESET Retention: {elapsed:.1f}s / {half_duration:.1f}s - R: {resistance:.2e} Ω")
                 
+                if self.stop_event.wait(interval):
+                    break
+
         except Exception as e:
             self.root.after(0, messagebox.showerror, "Measurement Error", f"Error during retention test: {str(e)}")
         finally:
             try:
-                self.smu.write(":SOUR:VOLT:LEV 0")
-                self.smu.write(":OUTP OFF")
+                self._write_many(":SOUR:VOLT:LEV 0", ":OUTP OFF")
+                self._last_smu_state['outp'] = 'OFF'
             except Exception:
                 pass
+            self._stopped.set()
             self.root.after(0, self._sweep_completed)
     
+    def _perform_retention_half_hw(self, state, cycle, vread, half_duration, interval, progress_base):
+        """Run one retention half paced by the instrument's arm timer"""
+        n_reads = max(int(half_duration / interval), 1)
+        label = state.split('_')[0]
+
+        self.smu.write(f":SOUR:VOLT:LEV {vread}")
+        acq_start = time.time()
+        data = self._run_timed_acquisition(n_reads, interval)
+
+        for k, (v_read_val, current, t_inst) in enumerate(data):
+            resistance = abs(v_read_val / current) if abs(current) > 1e-12 else float('inf')
+            # Anchor the instrument's relative timestamp to the epoch so the
+            # exported time axis reflects when each read was actually taken
+            timestamp = acq_start + float(t_inst)
+            extra = f"{label}@{float(t_inst):.1f}s"
+            self._record_point(timestamp, vread, current, resistance, cycle, state, extra)
+
+            progress = progress_base + (k + 1) / n_reads * 50
+            self._report_progress(progress)
+            self._queue_row(timestamp, vread, current, resistance, cycle, state, extra)
+
+        self._report_progress(status=f"{label} retention: {len(data)} readings from instrument buffer")
+
     def start_endurance_test(self):
         """Start endurance testing for memristors"""
         if not self.connected:
@@ -1205,13 +1938,13 @@ class KeithleySMUController:
             
             # Start measurement
             self.measurement_running = True
-            self.end_start_btn.config(state=tk.DISABLED)
-            self.end_stop_btn.config(state=tk.NORMAL)
+            self._set_ui_state('running')
             self.progress_var.set(0)
             
-            thread = threading.Thread(target=self._perform_endurance_test,
+            thread = threading.Thread(target=self._perform_endurance_test, name="endurance-worker",
                                     args=(vset, vreset, vread, compliance, cycles, pulse_width))
             thread.daemon = True
+            self.worker_thread = thread
             thread.start()
             
         except ValueError as e:
@@ -1219,83 +1952,157 @@ class KeithleySMUController:
         except Exception as e:
             messagebox.showerror("Error", f"Error starting endurance test: {str(e)}")
     
+    def _enable_pulse_mode(self, pulse_width):
+        """Try to let the instrument time pulses (pulse-capable 2400s only)"""
+        try:
+            self.smu.write(":SOUR:FUNC:SHAP PULS")
+            self.smu.write(f":SOUR:PULS:WIDT {pulse_width}")
+            self.smu.write(":SOUR:PULS:DEL 0")
+            err = self.smu.query(":SYST:ERR?")
+            if err.strip().startswith('0'):
+                return True
+            # Model without pulse mode: put the source back to DC
+            self.smu.write(":SOUR:FUNC:SHAP DC")
+            return False
+        except Exception as e:
+            self.logger.warning(f"Pulse mode unavailable, timing pulses in software: {e}")
+            return False
+
     def _perform_endurance_test(self, vset, vreset, vread, compliance, cycles, pulse_width):
         """Perform endurance testing"""
+        hw_pulse = False
+        stream_file = None
         try:
             # Configure SMU
             self._set_current_compliance_and_range(compliance, "AUTO")
-            self.smu.write(":OUTP ON")
-            time.sleep(0.1)
-            
-            self.data_points.clear()
+            self._set_output(True)
             
+            self._alloc_data(2 * cycles)
+
+            # 2600-series can run the whole pulse train on the instrument,
+            # which is the only way to honor millisecond pulse widths
+            if self.series_2600:
+                try:
+                    self._perform_endurance_tsp(vset, vreset, vread, cycles, pulse_width)
+                    return
+                except Exception as e:
+                    self.logger.warning(f"TSP endurance fast path failed, using host loop: {e}")
+                    # Stop the script if it is still executing so the host
+                    # loop isn't competing with it for the channel
+                    try:
+                        self.smu.write("abort")
+                        self.smu.write("*CLS")
+                    except Exception:
+                        pass
+
+            # Pulse-capable 2400-series (e.g. 2430) can time the pulse width
+            # on the instrument; time.sleep cannot hold millisecond widths
+            hw_pulse = self.series_2400 and self._enable_pulse_mode(pulse_width)
+
+            # The three source levels never change; format them once
+            cmd_set = f":SOUR:VOLT:LEV {vset}"
+            cmd_reset = f":SOUR:VOLT:LEV {vreset}"
+            cmd_read_v = f":SOUR:VOLT:LEV {vread}"
+
+            # Long host-looped runs stream every row to disk as it is taken,
+            # so a crash mid-test loses at most the write buffer and the
+            # data survives even if the app never reaches Export
+            stream_path = datetime.now().strftime("endurance_%Y%m%d_%H%M%S.csv")
+            stream_file = open(stream_path, 'w', buffering=1 << 20, newline='', encoding='utf-8')
+            stream_writer = csv.writer(stream_file)
+            stream_writer.writerow(['Time_Epoch_s', 'Voltage_V', 'Current_A', 'Resistance_Ohm', 'Cycle', 'State', 'Extra_Info'])
+            self.logger.info(f"Streaming endurance data to {stream_path}")
+
             for cycle in range(cycles):
                 if not self.measurement_running:
                     break
-                
+
                 # SET operation
-                self.smu.write(f":SOUR:VOLT:LEV {vset}")
-                time.sleep(pulse_width)
-                
-                # Read SET state
-                self.smu.write(f":SOUR:VOLT:LEV {vread}")
-                time.sleep(0.01)
-                reading = self.smu.query(":READ?")
-                v_read_val, current = self._safe_parse_reading(reading)
+                self.smu.write(cmd_set)
+                if hw_pulse:
+                    self.smu.write(":INIT")
+                    self.smu.query("*OPC?")
+                else:
+                    self._precise_wait(pulse_width)
+
+                # Read SET state (in pulse mode the read itself is a timed
+                # pulse at the read voltage)
+                self.smu.write(cmd_read_v)
+                v_read_val, current = self._read_point()
                 r_set = abs(v_read_val / current) if abs(current) > 1e-12 else float('inf')
-                
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                self.data_points.append({
-                    'timestamp': timestamp,
-                    'voltage': vset,
-                    'current': current,
-                    'resistance': r_set,
-                    'cycle': cycle + 1,
-                    'state': 'SET',
-                    'extra': f"SET_Cycle{cycle+1}"
-                })
-                
+
+                timestamp = time.time()
+                self._record_point(timestamp, vset, current, r_set,
+                                   cycle + 1, 'SET', f"SET_Cycle{cycle+1}")
+                stream_writer.writerow((timestamp, vset, current, r_set,
+                                        cycle + 1, 'SET', f"SET_Cycle{cycle+1}"))
+
                 # RESET operation
-                self.smu.write(f":SOUR:VOLT:LEV {vreset}")
-                time.sleep(pulse_width)
-                
+                self.smu.write(cmd_reset)
+                if hw_pulse:
+                    self.smu.write(":INIT")
+                    self.smu.query("*OPC?")
+                else:
+                    self._precise_wait(pulse_width)
+
                 # Read RESET state
-                self.smu.write(f":SOUR:VOLT:LEV {vread}")
-                time.sleep(0.01)
-                reading = self.smu.query(":READ?")
-                v_read_val, current = self._safe_parse_reading(reading)
+                self.smu.write(cmd_read_v)
+                v_read_val, current = self._read_point()
                 r_reset = abs(v_read_val / current) if abs(current) > 1e-12 else float('inf')
                 
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                self.data_points.append({
-                    'timestamp': timestamp,
-                    'voltage': vreset,
-                    'current': current,
-                    'resistance': r_reset,
-                    'cycle': cycle + 1,
-                    'state': 'RESET',
-                    'extra': f"RESET_Cycle{cycle+1}"
-                })
+                timestamp = time.time()
+                self._record_point(timestamp, vreset, current, r_reset,
+                                   cycle + 1, 'RESET', f"RESET_Cycle{cycle+1}")
+                stream_writer.writerow((timestamp, vreset, current, r_reset,
+                                        cycle + 1, 'RESET', f"RESET_Cycle{cycle+1}"))
                 
                 # Update GUI
                 progress = (cycle + 1) / cycles * 100
-                self.root.after(0, self._update_progress, progress)
-                self.root.after(0, self._update_data_table, timestamp, vset, current, r_set, cycle + 1, 'SET', f"SET_C{cycle+1}")
-                self.root.after(0, self._update_data_table, timestamp, vreset, current, r_reset, cycle + 1, 'RESET', f"RESET_C{cycle+1}")
-                self.root.after(0, self.status_var.set, f"Endurance: Cycle {cycle+1}/{cycles} - SET: {r_set:.2e}Ω, RESET: {r_reset:.2e}Ω")
+                self._queue_row(timestamp, vset, current, r_set, cycle + 1, 'SET', f"SET_C{cycle+1}")
+                self._queue_row(timestamp, vreset, current, r_reset, cycle + 1, 'RESET', f"RESET_C{cycle+1}")
+                self._report_progress(progress, f"Endurance: Cycle {cycle+1}/{cycles} - SET: {r_set:.2e}Ω, RESET: {r_reset:.2e}Ω")
                 
                 time.sleep(0.001)
                 
         except Exception as e:
             self.root.after(0, messagebox.showerror, "Measurement Error", f"Error during endurance test: {str(e)}")
         finally:
+            if stream_file is not None:
+                try:
+                    stream_file.close()
+                except Exception:
+                    pass
             try:
-                self.smu.write(":SOUR:VOLT:LEV 0")
-                self.smu.write(":OUTP OFF")
+                if hw_pulse:
+                    self.smu.write(":SOUR:FUNC:SHAP DC")
+                self._write_many(":SOUR:VOLT:LEV 0", ":OUTP OFF")
+                self._last_smu_state['outp'] = 'OFF'
             except Exception:
                 pass
+            self._stopped.set()
             self.root.after(0, self._sweep_completed)
-    
+
+    def _perform_endurance_tsp(self, vset, vreset, vread, cycles, pulse_width):
+        """Record a TSP-executed endurance run into the data table"""
+        self._report_progress(status=f"Endurance: running {cycles} cycles on the instrument...")
+        currents = self._run_tsp_endurance(vset, vreset, vread, cycles, pulse_width)
+
+        # Buffer holds SET read / RESET read pairs per cycle
+        pairs = currents.reshape(-1, 2)
+        for cycle, (i_set, i_reset) in enumerate(pairs):
+            r_set = abs(vread / i_set) if abs(i_set) > 1e-12 else float('inf')
+            r_reset = abs(vread / i_reset) if abs(i_reset) > 1e-12 else float('inf')
+
+            timestamp = time.time()
+            self._record_point(timestamp, vset, i_set, r_set,
+                               cycle + 1, 'SET', f"SET_Cycle{cycle+1}")
+            self._record_point(timestamp, vreset, i_reset, r_reset,
+                               cycle + 1, 'RESET', f"RESET_Cycle{cycle+1}")
+            self._queue_row(timestamp, vset, i_set, r_set, cycle + 1, 'SET', f"SET_C{cycle+1}")
+            self._queue_row(timestamp, vreset, i_reset, r_reset, cycle + 1, 'RESET', f"RESET_C{cycle+1}")
+
+        self._report_progress(100, f"Endurance: {len(pairs)} cycles read back from instrument buffer")
+
     def stop_measurement(self):
         """Stop ongoing measurement"""
         try:
@@ -1309,171 +2116,269 @@ class KeithleySMUController:
         """Finalize the stop process"""
         try:
             if self.smu:
-                self.smu.write(":OUTP OFF")
-            
-            # Re-enable all start buttons
-            self.iv_start_btn.config(state=tk.NORMAL)
-            self.loop_start_btn.config(state=tk.NORMAL)
-            self.ret_start_btn.config(state=tk.NORMAL)
-            self.end_start_btn.config(state=tk.NORMAL)
-            
-            # Disable all stop buttons
-            self.iv_stop_btn.config(state=tk.DISABLED)
-            self.loop_stop_btn.config(state=tk.DISABLED)
-            self.ret_stop_btn.config(state=tk.DISABLED)
-            self.end_stop_btn.config(state=tk.DISABLED)
-            
+                self._set_output(False)
+            # A stopped run may have left the instrument mid-change; make the
+            # next run re-apply its settings
+            self._last_smu_state = {}
+
+            self._set_ui_state('idle')
+
             self.status_var.set("Measurement stopped by user")
         except Exception as e:
             self.logger.error(f"Error finalizing stop: {e}")
     
-    def _update_progress(self, value):
-        """Update progress bar"""
-        self.progress_var.set(value)
+    def _report_progress(self, progress=None, status=None):
+        """Publish progress/status from a worker thread; latest value wins
+
+        Plain attribute writes cost nothing in the measurement loop; the GUI
+        pump applies the most recent values once per tick.
+        """
+        if progress is not None:
+            self._latest_progress = progress
+        if status is not None:
+            self._latest_status = status
     
+    def _queue_row(self, timestamp, voltage, current, resistance, cycle, state, extra_info):
+        """Hand a display row to the GUI pump without touching Tk from a worker"""
+        try:
+            self._ui_queue.put_nowait((timestamp, voltage, current, resistance, cycle, state, extra_info))
+        except queue.Full:
+            # Drop the display row rather than stall the measurement;
+            # the point itself is already stored in data_points
+            pass
+
+    def _drain_queue(self):
+        """Batch-insert queued rows into the data table on the Tk thread"""
+        drained = 0
+        if not self._ui_queue.empty():
+            # Pull everything pending first; only the rows that can stay
+            # within the widget's window are worth inserting at all, the
+            # rest would be evicted in the same tick
+            rows = []
+            for _ in range(4 * self._max_tree_rows):
+                try:
+                    rows.append(self._ui_queue.get_nowait())
+                except queue.Empty:
+                    break
+            drained = len(rows)
+
+            # Detach the scrollbar callback so Tcl does not recompute the
+            # scroll geometry once per inserted row
+            self.data_tree.configure(yscrollcommand='')
+            try:
+                for row in rows[-self._max_tree_rows:]:
+                    self._update_data_table(*row)
+
+                # Evict the oldest widget rows; the data itself is kept
+                while len(self._tree_iids) > self._max_tree_rows:
+                    self.data_tree.delete(self._tree_iids.popleft())
+            finally:
+                self.data_tree.configure(yscrollcommand=self._vscroll.set)
+            self._scroll_to_latest()
+        if drained:
+            self._update_live_plot()
+
+        # Apply the most recent progress/status published by the workers
+        if self._latest_progress is not None:
+            self.progress_var.set(self._latest_progress)
+            self._latest_progress = None
+        if self._latest_status is not None:
+            self.status_var.set(self._latest_status)
+            self._latest_status = None
+
+        self.root.after(50, self._drain_queue)
+
+    def _bulk_update_table(self, rows):
+        """Insert a whole acquisition's rows into the GUI in one batch"""
+        self.data_tree.configure(yscrollcommand='')
+        try:
+            for row in rows[-self._max_tree_rows:]:
+                self._update_data_table(row['t'], row['voltage'], row['current'],
+                                        row['resistance'], row['cycle'], row['state'], row['extra'])
+            while len(self._tree_iids) > self._max_tree_rows:
+                self.data_tree.delete(self._tree_iids.popleft())
+        finally:
+            self.data_tree.configure(yscrollcommand=self._vscroll.set)
+        self._scroll_to_latest()
+        self._update_live_plot()
+
+    def _format_ts(self, t):
+        """Format a wall-clock float for display; points store raw seconds"""
+        return datetime.fromtimestamp(t).strftime("%H:%M:%S.%f")[:-3]
+
     def _update_data_table(self, timestamp, voltage, current, resistance, cycle, state, extra_info):
         """Update the data table with new measurement"""
-        self.data_tree.insert('', 'end', values=(
-            timestamp, 
-            f"{voltage:.6f}", 
-            f"{current:.6e}", 
-            f"{resistance:.6e}",
+        v_s, i_s, r_s = (_ROW_FMT % (voltage, current, resistance)).split('|')
+        iid = self.data_tree.insert('', 'end', values=(
+            self._format_ts(timestamp),
+            v_s,
+            i_s,
+            r_s,
             cycle,
             state,
             extra_info
         ))
-        children = self.data_tree.get_children()
-        if children:
-            self.data_tree.see(children[-1])
-    
+        self._tree_iids.append(iid)
+
+    def _set_ui_state(self, state):
+        """Flip every start/stop button between 'running' and 'idle' at once
+
+        The cached state makes repeat transitions free, so chained short
+        runs do not cross the Tcl boundary eight times per completion.
+        """
+        if self._ui_state == state:
+            return
+        running = state == 'running'
+        for btn in self._start_btns:
+            btn.config(state=tk.DISABLED if running else tk.NORMAL)
+        for btn in self._stop_btns:
+            btn.config(state=tk.NORMAL if running else tk.DISABLED)
+        self._ui_state = state
+
+    def _scroll_to_latest(self):
+        """Bring the newest row into view; called once per batch, not per row"""
+        if self._tree_iids:
+            self.data_tree.see(self._tree_iids[-1])
+
     def _sweep_completed(self):
         """Called when sweep is completed"""
         self.measurement_running = False
         
-        # Re-enable all start buttons
-        self.iv_start_btn.config(state=tk.NORMAL)
-        try:
-            self.loop_start_btn.config(state=tk.NORMAL)
-            self.ret_start_btn.config(state=tk.NORMAL)
-            self.end_start_btn.config(state=tk.NORMAL)
-        except:
-            pass
-        
-        # Disable all stop buttons
-        self.iv_stop_btn.config(state=tk.DISABLED)
-        try:
-            self.loop_stop_btn.config(state=tk.DISABLED)
-            self.ret_stop_btn.config(state=tk.DISABLED)
-            self.end_stop_btn.config(state=tk.DISABLED)
-        except:
-            pass
-        
+        self._set_ui_state('idle')
+
         self.progress_var.set(100)
         self.status_var.set("Measurement completed")
     
     def export_csv(self):
         """Export data to CSV file"""
-        if not self.data_points:
+        if self._point_count == 0:
             messagebox.showwarning("No Data", "No data to export")
             return
         
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            title="Save measurement data"
+        )
+        if not filename:
+            return
+
+        # Snapshot the rows on the main thread so the writer never races a
+        # measurement appending new points, then write off-thread so a
+        # multi-second export does not freeze the UI
+        rows = self.data_points[:self._point_count].copy()
+        model = self.model if self.model else "Unknown"
+        threading.Thread(target=self._write_csv, name="csv-export-worker",
+                         args=(filename, rows, model), daemon=True).start()
+        self.status_var.set(f"Exporting {len(rows)} points...")
+
+    def _write_csv(self, filename, rows, model):
+        """Write a snapshot of the data to disk; runs on an export thread"""
         try:
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-                title="Save measurement data"
-            )
-            
-            if filename:
-                with open(filename, 'w', newline='',encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    
-                    # Write header with metadata
-                    writer.writerow(['# Keithley SMU Measurement Data'])
-                    writer.writerow(['# Timestamp:', datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
-                    writer.writerow(['# Instrument:', self.model if self.model else "Unknown"])
-                    writer.writerow(['# Total Points:', len(self.data_points)])
-                    writer.writerow([])
-                    
-                    # Write data header
-                    writer.writerow(['Timestamp', 'Voltage_V', 'Current_A', 'Resistance_Ohm', 'Cycle', 'State', 'Extra_Info'])
-                    
-                    # Write data
-                    for point in self.data_points:
-                        if isinstance(point, dict):
-                            writer.writerow([
-                                point['timestamp'],
-                                point['voltage'],
-                                point['current'],
-                                point['resistance'],
-                                point['cycle'],
-                                point['state'],
-                                point['extra']
-                            ])
-                        else:
-                            # Legacy format support
-                            writer.writerow(point)
-                
-                messagebox.showinfo("Export Complete", f"Data exported to {filename}")
-                self.logger.info(f"Data exported to {filename}")
-                
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
+
+                # Write header with metadata
+                writer.writerow(['# Keithley SMU Measurement Data'])
+                writer.writerow(['# Timestamp:', datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
+                writer.writerow(['# Instrument:', model])
+                writer.writerow(['# Total Points:', len(rows)])
+                writer.writerow([])
+
+                # Write data header
+                writer.writerow(['Time_Epoch_s', 'Voltage_V', 'Current_A', 'Resistance_Ohm', 'Cycle', 'State', 'Extra_Info'])
+
+                # Bulk-write the structured array in one C-level loop
+                # instead of formatting row by row in Python
+                np.savetxt(csvfile, rows,
+                           fmt=['%.6f', '%.6g', '%.6g', '%.6g', '%d', '%s', '%s'],
+                           delimiter=',')
+
+            self.logger.info(f"Data exported to {filename}")
+            self.root.after(0, messagebox.showinfo, "Export Complete", f"Data exported to {filename}")
+
         except Exception as e:
             self.logger.error(f"Export error: {e}")
-            messagebox.showerror("Export Error", f"Error exporting data: {str(e)}")
+            self.root.after(0, messagebox.showerror, "Export Error", f"Error exporting data: {str(e)}")
     
+    def _preload_mpl(self):
+        """Import pyplot off the UI thread; plot_external picks it up"""
+        try:
+            import matplotlib.pyplot
+            self._plt = matplotlib.pyplot
+        except ImportError:
+            pass
+
     def plot_external(self):
         """Create external plot using matplotlib"""
-        if not self.data_points:
+        if self._point_count == 0:
             messagebox.showwarning("No Data", "No data to plot")
             return
-        
+
         try:
-            import matplotlib.pyplot as plt
-            
-            # Convert data format if needed
-            if isinstance(self.data_points[0], dict):
-                voltages = [point['voltage'] for point in self.data_points]
-                currents = [point['current'] for point in self.data_points]
-                cycles = [point['cycle'] for point in self.data_points]
-                states = [point['state'] for point in self.data_points]
+            plt = self._plt
+            if plt is None:
+                import matplotlib.pyplot as plt
+
+            # Column views into the structured measurement array, widened to
+            # float64 once and reused by all four panels
+            data = self.data_points[:self._point_count]
+            voltages = np.asarray(data['voltage'], dtype=np.float64)
+            currents = np.asarray(data['current'], dtype=np.float64)
+            cycles = data['cycle']
+            states = data['state']
+
+            # |I| feeds both the current panel and the resistance pass, so
+            # it is computed once; resistance keeps the 1 TΩ cap as before
+            abs_currents = np.abs(currents)
+            safe_i = np.where(abs_currents > 1e-15, abs_currents, 1.0)
+            resistances = np.minimum(np.abs(voltages) / safe_i, 1e12)
+            resistances[abs_currents <= 1e-15] = 1e12
+
+            # Beyond a few points per pixel extra samples add render time,
+            # not detail; every panel decimates with the same stride so
+            # they stay aligned point-for-point
+            if len(voltages) > 5000:
+                voltages = _decimate(voltages)
+                currents = _decimate(currents)
+                abs_currents = _decimate(abs_currents)
+                resistances = _decimate(resistances)
+                cycles = _decimate(cycles)
+
+            # Reuse the figure across invocations; building four axes and
+            # warming the font cache is the expensive part of a first plot
+            if getattr(self, '_ext_fig', None) is not None and plt.fignum_exists(self._ext_fig.number):
+                for ax in self._ext_axes.flat:
+                    ax.cla()
             else:
-                # Legacy format
-                voltages = [point[1] for point in self.data_points]
-                currents = [point[2] for point in self.data_points]
-                cycles = [1] * len(voltages)
-                states = ['Unknown'] * len(voltages)
-            
-            # Create comprehensive plots
-            fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+                self._ext_fig, self._ext_axes = plt.subplots(2, 2, figsize=(12, 10),
+                                                             constrained_layout=True)
+            fig, axes = self._ext_fig, self._ext_axes
             fig.suptitle('Keithley SMU Measurement Results')
             
             # I-V plot
-            axes[0,0].plot(voltages, currents, 'b.-', linewidth=1, markersize=2)
+            axes[0,0].plot(voltages, currents, 'b.-', linewidth=1, markersize=2, rasterized=True)
             axes[0,0].set_xlabel('Voltage (V)')
             axes[0,0].set_ylabel('Current (A)')
             axes[0,0].set_title('I-V Characteristic')
             axes[0,0].grid(True, alpha=0.3)
             
             # Current vs measurement point
-            axes[0,1].semilogy(range(len(currents)), np.abs(currents), 'r.-', linewidth=1, markersize=2)
+            axes[0,1].semilogy(range(len(currents)), abs_currents, 'r.-', linewidth=1, markersize=2, rasterized=True)
             axes[0,1].set_xlabel('Measurement Point')
             axes[0,1].set_ylabel('|Current| (A)')
             axes[0,1].set_title('Current vs Measurement Point')
             axes[0,1].grid(True, alpha=0.3)
             
-            # Resistance calculation and plot
-            resistances = [abs(v/c) if abs(c) > 1e-15 else 1e12 for v, c in zip(voltages, currents)]
-            resistances = [min(r, 1e12) for r in resistances]  # Cap at 1 TΩ
-            
-            axes[1,0].semilogy(range(len(resistances)), resistances, 'g.-', linewidth=1, markersize=2)
+            axes[1,0].semilogy(range(len(resistances)), resistances, 'g.-', linewidth=1, markersize=2, rasterized=True)
             axes[1,0].set_xlabel('Measurement Point')
             axes[1,0].set_ylabel('Resistance (Ω)')
             axes[1,0].set_title('Resistance vs Measurement Point')
             axes[1,0].grid(True, alpha=0.3)
             
             # Cycle information if available
-            if len(set(cycles)) > 1:
-                axes[1,1].plot(cycles, resistances, 'k.-', linewidth=1, markersize=2)
+            if len(cycles) and cycles.max() != cycles.min():
+                axes[1,1].plot(cycles, resistances, 'k.-', linewidth=1, markersize=2, rasterized=True)
                 axes[1,1].set_xlabel('Cycle Number')
                 axes[1,1].set_ylabel('Resistance (Ω)')
                 axes[1,1].set_title('Resistance vs Cycle')
@@ -1484,8 +2389,11 @@ class KeithleySMUController:
                 axes[1,1].set_title('Cycle Analysis')
             axes[1,1].grid(True, alpha=0.3)
             
-            plt.tight_layout()
-            plt.show()
+            # Raster data layer renders at a fixed resolution while the
+            # axes and labels stay vector
+            fig.set_dpi(150)
+            fig.canvas.draw_idle()
+            plt.show(block=False)
             
         except ImportError:
             messagebox.showinfo("Matplotlib Not Available",
@@ -1499,9 +2407,16 @@ class KeithleySMUController:
     
     def clear_data(self):
         """Clear all measurement data"""
-        self.data_points.clear()
-        for item in self.data_tree.get_children():
-            self.data_tree.delete(item)
+        self.data_points = np.empty(0, dtype=POINT_DTYPE)
+        self._point_count = 0
+        if self._live_canvas is not None:
+            self._live_line.set_data([], [])
+            self._live_canvas.draw()  # draw_event recaptures the blit background
+        self._tree_iids.clear()
+        # One Tcl call clears every row instead of one call per row
+        children = self.data_tree.get_children()
+        if children:
+            self.data_tree.delete(*children)
         self.progress_var.set(0)
         self.status_var.set("Data cleared")
 
@@ -1514,7 +2429,8 @@ def main():
     def on_closing():
         try:
             app.measurement_running = False
-            time.sleep(0.1)
+            # Returns the moment the worker's cleanup actually finishes
+            app._stopped.wait(0.5)
             if app.connected:
                 app.disconnect_instrument()
         except Exception as e: